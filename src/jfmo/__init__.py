@@ -1,16 +1,25 @@
+from __future__ import annotations
+
 import os
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
 from .cli import CLI
 from .config import config
-from .daemon import FileWatcher
-from .di import Container
 from .exceptions import DirectoryNotFoundError, TransliterationModelError
 from .utils.cli_output import print_dry_run_banner, print_entry_header, print_header, print_result, print_summary
-from .utils.fs.file_ops import is_video_file
+from .utils.fs.file_ops import iter_media_entries
+
+# The container pulls in requests, transliterate and the language models;
+# it is imported inside _run/_run_daemon so --help and --version stay fast.
+if TYPE_CHECKING:
+    from .formatter import Formatter
+    from .processors.result import ProcessResult
 
 EXIT_SUCCESS = 0
 EXIT_CONFIG_ERROR = 1
@@ -19,18 +28,24 @@ EXIT_SYSTEM_ERROR = 5
 EXIT_MODEL_ERROR = 6
 
 
+def _format_entry(formatter: Formatter, entry: os.DirEntry) -> list[ProcessResult] | None:
+    """Format one downloads entry. Returns None when a single file was skipped."""
+    if entry.is_dir():
+        return formatter.format_directory(entry.path)
+    result = formatter.format_file(entry.path)
+    return None if result is None else [result]
+
+
 def _run(apply: bool) -> None:
+    from .di import Container
+
     config.DRY_RUN = not apply
     container = Container()
 
     show_output = not config.DAEMON_MODE
 
-    video_entries = [
-        name
-        for name in os.listdir(config.DOWNLOADS_DIR)
-        if os.path.isdir(os.path.join(config.DOWNLOADS_DIR, name))
-        or (os.path.isfile(os.path.join(config.DOWNLOADS_DIR, name)) and is_video_file(name))
-    ]
+    # Materialized only because the header needs the entry count up front
+    video_entries = list(iter_media_entries(config.DOWNLOADS_DIR))
 
     if show_output and config.DRY_RUN:
         print_dry_run_banner()
@@ -40,26 +55,26 @@ def _run(apply: bool) -> None:
     all_results = []
     skipped_count = 0
 
-    for name in video_entries:
-        path = os.path.join(config.DOWNLOADS_DIR, name)
+    try:
+        # Entries are independent and mostly wait on TMDB, so format them concurrently.
+        # pool.map keeps input order, so output is still printed entry by entry.
+        with ThreadPoolExecutor(max_workers=config.WORKERS) as pool:
+            outcomes = pool.map(partial(_format_entry, container.formatter), video_entries)
+            for entry, results in zip(video_entries, outcomes, strict=True):
+                if show_output:
+                    print_entry_header(entry.name, is_dir=entry.is_dir())
 
-        if show_output:
-            print_entry_header(name, is_dir=os.path.isdir(path))
+                if results is None:
+                    skipped_count += 1
+                    continue
 
-        if os.path.isdir(path):
-            results = container.formatter.format_directory(path)
-            all_results.extend(results)
-            if show_output:
-                for r in results:
-                    print_result(r)
-        else:
-            result = container.formatter.format_file(path)
-            if result is None:
-                skipped_count += 1
-            else:
-                all_results.append(result)
+                all_results.extend(results)
                 if show_output:
-                    print_result(result)
+                    for r in results:
+                        print_result(r)
+    finally:
+        # Keep the matches resolved so far even when the run is interrupted
+        container.tmdb_client.save_cache()
 
     if show_output:
         print_summary(all_results, skipped_count, config.DRY_RUN)
@@ -68,8 +83,17 @@ def _run(apply: bool) -> None:
 
 
 def _run_daemon() -> None:
+    from .daemon import FileWatcher
+    from .di import Container
+
     container = Container()
-    watcher = FileWatcher(config.DOWNLOADS_DIR, config.DAEMON_INTERVAL_SEC, container.formatter)
+    watcher = FileWatcher(
+        config.DOWNLOADS_DIR,
+        config.DAEMON_INTERVAL_SEC,
+        container.formatter,
+        config.WORKERS,
+        on_cycle_end=container.tmdb_client.save_cache,
+    )
 
     def _stop(signum, _frame):
         logger.info(f"Signal {signum}. Stopping...")
@@ -81,7 +105,11 @@ def _run_daemon() -> None:
 
     logger.info("Daemon starting...")
     logger.info(config)
-    watcher.start()
+    try:
+        watcher.start()
+    finally:
+        # _stop exits from the signal handler, so this is the shutdown path too
+        container.tmdb_client.save_cache()
 
 
 def main():
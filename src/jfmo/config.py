@@ -36,6 +36,8 @@ _VALID_TOKENS: dict[str, set[Token]] = {
     },
 }
 
+_TOKEN_PATTERN = re.compile(r"\{(\w+)\}")  # {title}, {year}, ...
+
 
 class Config:
     def __init__(self) -> None:
@@ -43,6 +45,9 @@ class Config:
 
         self.DAEMON_INTERVAL_SEC: int = 30
 
+        # Downloads entries formatted in parallel by `run`
+        self.WORKERS: int = 4
+
         self.DOWNLOADS_DIR: str
         self.MOVIES_DIR: str
         self.TV_DIR: str
@@ -55,6 +60,8 @@ class Config:
 
         # TMDB configuration
         self.TMDB_API_KEY: str | None = None
+        # Resolved matches kept across runs; off unless tmdb.cache_file points somewhere writable
+        self.TMDB_CACHE_FILE: str | None = None
 
         self.DRY_RUN: bool = False
         self.DAEMON_MODE: bool = False
@@ -114,6 +121,10 @@ class Config:
         if "daemon" in data and "interval" in data["daemon"]:
             self.DAEMON_INTERVAL_SEC = data["daemon"]["interval"]
 
+        # Processing
+        if "processing" in data and "workers" in data["processing"]:
+            self.WORKERS = data["processing"]["workers"]
+
         # Directories
         if "directories" in data:
             dirs = data["directories"]
@@ -145,6 +156,8 @@ class Config:
         # TMDB
         if "tmdb" in data and (api_key := data["tmdb"].get("api_key")):
             self.TMDB_API_KEY = api_key
+        if "tmdb" in data and "cache_file" in data["tmdb"]:
+            self.TMDB_CACHE_FILE = data["tmdb"]["cache_file"] or None
 
         self._setup_logger()
         self._validate()
@@ -171,6 +184,9 @@ class Config:
         if self.DAEMON_INTERVAL_SEC < 30:
             errors.append(f"daemon.interval must be >= 30, got {self.DAEMON_INTERVAL_SEC}")
 
+        if self.WORKERS < 1:
+            errors.append(f"processing.workers must be >= 1, got {self.WORKERS}")
+
         errors.extend(self._validate_naming_patterns())
 
         if errors:
@@ -178,7 +194,6 @@ class Config:
 
     def _validate_naming_patterns(self) -> list[str]:
         errors = []
-        token_pattern = re.compile(r"\{(\w+)\}")
 
         for label, pattern in [
             ("naming.movie.file", self.FORMAT_MOVIE_FILE),
@@ -186,7 +201,7 @@ class Config:
             ("naming.tv.season", self.FORMAT_TV_SEASON_FOLDER),
             ("naming.tv.file", self.FORMAT_TV_FILE),
         ]:
-            used_tokens = set(token_pattern.findall(pattern))
+            used_tokens = set(_TOKEN_PATTERN.findall(pattern))
             unknown = used_tokens - _VALID_TOKENS[label]
             if unknown:
                 errors.append(f"{label}: invalid tokens {unknown} (allowed: {_VALID_TOKENS[label]})")
@@ -198,7 +213,7 @@ class Config:
             f"Current configuration:\n"
             f"  Download: {self.DOWNLOADS_DIR}\n"
             f"  Movies: {self.MOVIES_DIR} - TV: {self.TV_DIR}\n"
-            f"  Daemon Interval: {self.DAEMON_INTERVAL_SEC} sec\n"
+            f"  Daemon Interval: {self.DAEMON_INTERVAL_SEC} sec - Workers: {self.WORKERS}\n"
             f"  TMDB Integration: {'enable' if self.TMDB_API_KEY else 'disable'}"
         )
 
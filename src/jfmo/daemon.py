@@ -1,19 +1,30 @@
 import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from threading import Event
 
 from loguru import logger
 
 from .formatter import Formatter
-from .utils.fs.file_ops import is_video_file
+from .utils.fs.file_ops import is_video_file, iter_media_entries
 from .utils.fs.file_stability_tracker import FileStabilityTracker
 
 
 class FileWatcher:
-    def __init__(self, watch_dir: str, check_interval: int, formatter: Formatter) -> None:
+    def __init__(
+        self,
+        watch_dir: str,
+        check_interval: int,
+        formatter: Formatter,
+        workers: int = 1,
+        on_cycle_end: Callable[[], None] | None = None,
+    ) -> None:
         self.watch_dir = watch_dir
         self.check_interval = check_interval
         self.formatter = formatter
+        self.workers = workers
+        self.on_cycle_end = on_cycle_end
         self.known_entries: set[str] = set()
         self.pending_entries: set[str] = set()
         self.stability_tracker = FileStabilityTracker(stability_cycles=2)
@@ -24,47 +35,55 @@ class FileWatcher:
         """Return direct children of watch_dir (dirs and video files)."""
         found: set[str] = set()
         try:
-            for name in os.listdir(self.watch_dir):
-                path = os.path.join(self.watch_dir, name)
-                if os.path.isdir(path) or (os.path.isfile(path) and is_video_file(name)):
-                    found.add(path)
+            found.update(entry.path for entry in iter_media_entries(self.watch_dir))
         except Exception as e:
             logger.error(f"Error scanning directory: {e}")
         return found
 
-    def _is_stable(self, path: str) -> bool:
-        """Check stability: for dirs, check all video files inside are stable."""
-        if os.path.isfile(path):
-            return self.stability_tracker.is_stable(path)
-        for root, _, filenames in os.walk(path):
+    def _stable_videos(self, path: str, is_dir: bool) -> list[str] | None:
+        """Check stability: return the entry's video files once all of them are stable, else None."""
+        if not is_dir:
+            return [path] if self.stability_tracker.is_stable(path) else None
+        videos: list[str] = []
+        # fwalk keeps each directory open, so sizes are read with fstatat relative to it
+        # instead of resolving the full path of every file again.
+        # It never follows the entry itself when that is a symlink, so walk the real path
+        # and report files under path, as the formatter sees them.
+        real_path = os.path.realpath(path)
+        for root, _, filenames, root_fd in os.fwalk(real_path):
+            prefix = os.path.join(path + root[len(real_path) :], "")
             for filename in filenames:
-                if is_video_file(filename) and not self.stability_tracker.is_stable(os.path.join(root, filename)):
-                    return False
-        return True
-
-    def _mark_processed(self, path: str) -> None:
-        if os.path.isfile(path):
-            self.stability_tracker.mark_processed(path)
-        else:
-            for root, _, filenames in os.walk(path):
-                for filename in filenames:
-                    if is_video_file(filename):
-                        self.stability_tracker.mark_processed(os.path.join(root, filename))
+                if not is_video_file(filename):
+                    continue
+                try:
+                    size = os.stat(filename, dir_fd=root_fd).st_size
+                except OSError:
+                    # File deleted or inaccessible
+                    self.stability_tracker.mark_processed(prefix + filename)
+                    return None
+                if not self.stability_tracker.is_stable(prefix + filename, size):
+                    return None
+                videos.append(prefix + filename)
+        return videos
 
     def _ts(self) -> str:
         return datetime.now().strftime("%H:%M:%S")
 
     def _process_pending_entry(self, path: str) -> bool:
         name = os.path.basename(path)
+        is_dir = os.path.isdir(path)  # one stat per entry, shared by the checks below
 
-        if not self._is_stable(path):
+        videos = self._stable_videos(path, is_dir)
+        if videos is None:
             return False
 
-        self._mark_processed(path)
+        # The stability walk already listed every video, so they are untracked without a second walk
+        for video in videos:
+            self.stability_tracker.mark_processed(video)
         logger.info(f"New entry: {name}")
 
         try:
-            result = self.formatter.format_directory(path) if os.path.isdir(path) else self.formatter.format_file(path)
+            result = self.formatter.format_directory(path) if is_dir else self.formatter.format_file(path)
 
             if result is None:
                 logger.info(f"Skipped: {name}")
@@ -81,35 +100,41 @@ class FileWatcher:
         self.known_entries = self._scan_entries()
         logger.info(f"Watching {len(self.known_entries)} existing entries")
 
-        while not self.stop_event.is_set():
-            try:
-                current_entries = self._scan_entries()
-                new_entries = current_entries - self.known_entries
-
-                self.pending_entries.update(new_entries)
-
-                # Keep only entries still on disk; process the stable ones
-                self.pending_entries &= current_entries
-                for path in list(self.pending_entries):
-                    if self._process_pending_entry(path):
-                        self.pending_entries.discard(path)
-                        self.known_entries.add(path)
-
-                # Drop known entries that disappeared from disk
-                self.known_entries &= current_entries
-                self._cycle += 1
-
-                if self._cycle % 10 == 0:
-                    logger.info(f"[{self._ts()}] watching {len(current_entries)} entries")
-
-                self.stop_event.wait(self.check_interval)
-
-            except KeyboardInterrupt:
-                logger.info("Interrupted")
-                break
-            except Exception as e:
-                logger.error(f"Watch loop error: {e}")
-                self.stop_event.wait(self.check_interval)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while not self.stop_event.is_set():
+                try:
+                    current_entries = self._scan_entries()
+                    new_entries = current_entries - self.known_entries
+
+                    self.pending_entries.update(new_entries)
+
+                    # Keep only entries still on disk; process the stable ones.
+                    # Entries are independent and mostly wait on TMDB, so they share the worker pool.
+                    self.pending_entries &= current_entries
+                    paths = list(self.pending_entries)
+                    for path, done in zip(paths, pool.map(self._process_pending_entry, paths), strict=True):
+                        if done:
+                            self.pending_entries.discard(path)
+                            self.known_entries.add(path)
+
+                    # Drop known entries that disappeared from disk
+                    self.known_entries &= current_entries
+                    self._cycle += 1
+
+                    if self.on_cycle_end:
+                        self.on_cycle_end()
+
+                    if self._cycle % 10 == 0:
+                        logger.info(f"[{self._ts()}] watching {len(current_entries)} entries")
+
+                    self.stop_event.wait(self.check_interval)
+
+                except KeyboardInterrupt:
+                    logger.info("Interrupted")
+                    break
+                except Exception as e:
+                    logger.error(f"Watch loop error: {e}")
+                    self.stop_event.wait(self.check_interval)
 
     def stop(self) -> None:
         self.stop_event.set()
@@ -21,7 +21,7 @@ from .processors import MovieProcessor, TvProcessor
 
 class Container:
     def __init__(self) -> None:
-        self.tmdb_client = TMDBClient(config.TMDB_API_KEY)
+        self.tmdb_client = TMDBClient(config.TMDB_API_KEY, config.TMDB_CACHE_FILE)
 
         self.parser = Parser(
             ExtensionStep(),
@@ -8,7 +8,7 @@ from .processors.movie_processor import MovieProcessor
 from .processors.result import ProcessResult
 from .processors.tv_processor import TvProcessor
 from .transliteration import Transliterator
-from .utils.fs.file_ops import is_video_file
+from .utils.fs.file_ops import iter_video_dirs
 
 
 class Formatter:
@@ -32,28 +32,32 @@ class Formatter:
         root_season = root_ctx.tokens.get(Token.SEASON)
         root_title = root_ctx.tokens.get(Token.TITLE, "")
 
+        # Bound once: the inner loop runs for every video file in the tree
+        parse = self._parser.parse
+        transliterate = Transliterator.transliterate_text
+        process = self._tv.process
+
         results: list[ProcessResult] = []
-        for current_dir, _, files in os.walk(dirpath):
+        for current_dir, videos in iter_video_dirs(dirpath):
             # Determine season: filename > subdirectory > root dir > None
             if current_dir == dirpath:
                 effective_season = root_season
             else:
-                sub_ctx = self._parser.parse(os.path.basename(current_dir))
+                sub_ctx = parse(os.path.basename(current_dir))
                 effective_season = sub_ctx.tokens.get(Token.SEASON) or root_season
 
-            for file in files:
-                if is_video_file(file):
-                    filepath = os.path.join(current_dir, file)
-                    tokens = {Token.SEASON: effective_season} if effective_season else {}
-                    seed = ParseContext(filepath=filepath, tokens=tokens)
-                    ctx = self._parser.parse(filepath, seed=seed)
-                    if ctx.skip_reason:
-                        logger.info(f"Skipped {file}: {ctx.skip_reason}")
-                        continue
-                    if not ctx.tokens.get(Token.TITLE) and root_title:
-                        ctx.tokens[Token.TITLE] = Transliterator.transliterate_text(root_title)
-                    else:
-                        ctx.tokens[Token.TITLE] = Transliterator.transliterate_text(ctx.tokens.get(Token.TITLE, ""))
-                    results.append(self._tv.process(ctx))
+            for entry in videos:
+                tokens = {Token.SEASON: effective_season} if effective_season else {}
+                # working_name seeded from the entry, so the parser doesn't re-derive the basename
+                seed = ParseContext(filepath=entry.path, working_name=entry.name, tokens=tokens)
+                ctx = parse(entry.path, seed=seed)
+                if ctx.skip_reason:
+                    logger.info(f"Skipped {entry.name}: {ctx.skip_reason}")
+                    continue
+                if not ctx.tokens.get(Token.TITLE) and root_title:
+                    ctx.tokens[Token.TITLE] = transliterate(root_title)
+                else:
+                    ctx.tokens[Token.TITLE] = transliterate(ctx.tokens.get(Token.TITLE, ""))
+                results.append(process(ctx))
 
         return results
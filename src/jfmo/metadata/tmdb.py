@@ -1,18 +1,39 @@
-import requests
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING
+
 from loguru import logger
 
+if TYPE_CHECKING:
+    import requests
+
+# Matches read back from the cache file are trusted this long before TMDB is asked again
+_DISK_CACHE_TTL_SEC = 30 * 24 * 60 * 60
+
 
 class TMDBClient:
     BASE_URL = "https://api.themoviedb.org/3"
 
-    def __init__(self, api_key: str | None = None) -> None:
+    def __init__(self, api_key: str | None = None, cache_file: str | None = None) -> None:
         self.api_key = api_key
-        self._cache: dict[str, tuple[int | None, str | None]] = {}
+        self._cache: dict[tuple[str, str, str], tuple[int | None, str | None]] = {}
+        self._session: requests.Session | None = None
+
+        # Matches for the cache file: (endpoint, title, year) -> (tmdb_id, year, stored_at).
+        # New ones are only buffered here; save_cache writes them out in one go.
+        self._cache_file = cache_file
+        self._persisted: dict[tuple[str, str, str], tuple[int, str | None, float]] = {}
+        self._unsaved = False
+        self._persist_lock = threading.Lock()
 
         if not self.api_key:
             logger.warning("TMDB API key not configured. TMDB integration disabled.")
         else:
             self._validate_api_key()
+            if self.api_key and self._cache_file:
+                self._load_disk_cache()
 
     def _validate_api_key(self) -> None:
         result = self._make_request("authentication")
@@ -22,24 +43,81 @@ class TMDBClient:
             logger.error("TMDB API key is invalid. TMDB integration disabled.")
             self.api_key = None
 
-    def _cache_get(self, title: str, year: str | None) -> tuple[int | None, str | None] | None:
-        return self._cache.get(f"{title}_{year or ''}")
-
-    def _cache_set(self, title: str, year: str | None, tmdb_id: int | None, result_year: str | None) -> None:
-        self._cache[f"{title}_{year or ''}"] = (tmdb_id, result_year)
+    # Keyed per endpoint so a movie and a show sharing a title don't collide; TMDB search ignores case
+    def _cache_get(self, endpoint: str, title: str, year: str | None) -> tuple[int | None, str | None] | None:
+        return self._cache.get((endpoint, title.lower(), year or ""))
+
+    def _cache_set(
+        self, endpoint: str, title: str, year: str | None, tmdb_id: int | None, result_year: str | None
+    ) -> None:
+        key = (endpoint, title.lower(), year or "")
+        self._cache[key] = (tmdb_id, result_year)
+        # Only matches are persisted: a title missing today may be added to TMDB tomorrow
+        if tmdb_id is not None and self._cache_file:
+            with self._persist_lock:
+                self._persisted[key] = (tmdb_id, result_year, time.time())
+                self._unsaved = True
+
+    def _load_disk_cache(self) -> None:
+        expired_before = time.time() - _DISK_CACHE_TTL_SEC
+        try:
+            with open(self._cache_file, encoding="utf-8") as f:
+                entries = json.load(f)
+            for endpoint, title, year, tmdb_id, result_year, stored_at in entries:
+                if stored_at >= expired_before:
+                    key = (endpoint, title, year)
+                    self._cache[key] = (tmdb_id, result_year)
+                    self._persisted[key] = (tmdb_id, result_year, stored_at)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable TMDB cache {self._cache_file}: {e}")
+            return
+        logger.info(f"Loaded {len(self._persisted)} cached TMDB matches from {self._cache_file}")
+
+    def save_cache(self) -> None:
+        """Write matches found since the last save to the cache file, dropping expired ones."""
+        with self._persist_lock:
+            if not self._cache_file or not self._unsaved:
+                return
+            # The daemon outlives the TTL: expired matches leave memory too, so TMDB is asked again
+            expired_before = time.time() - _DISK_CACHE_TTL_SEC
+            for key in [key for key, (*_, stored_at) in self._persisted.items() if stored_at < expired_before]:
+                del self._persisted[key]
+                self._cache.pop(key, None)
+            entries = [[*k, *v] for k, v in self._persisted.items()]
+            self._unsaved = False
+
+            tmp_file = f"{self._cache_file}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self._cache_file) or ".", exist_ok=True)
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(entries, f)
+                os.replace(tmp_file, self._cache_file)
+            except OSError as e:
+                logger.warning(f"Cannot write TMDB cache {self._cache_file}: {e}. Disk cache disabled.")
+                self._cache_file = None
 
     def _make_request(self, endpoint: str, params: dict | None = None) -> dict | None:
         if not self.api_key:
             return None
 
+        import requests  # deferred: runs without an API key never pay for importing it
+
+        # One keep-alive session for the whole run instead of a new TLS handshake per lookup
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update(
+                {
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json;charset=utf-8",
+                }
+            )
+
         url = f"{self.BASE_URL}/{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json;charset=utf-8",
-        }
 
         try:
-            response = requests.get(url, params=params, headers=headers)
+            response = self._session.get(url, params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -49,23 +127,26 @@ class TMDBClient:
     def _pick_best(
         self, candidates: list[dict], title: str, year: str | None, date_key: str, title_key: str
     ) -> dict | None:
-        if year:
-            exact_year = [c for c in candidates if c.get(date_key, "").startswith(year)]
-            if exact_year:
-                candidates = exact_year
-
+        # Most popular candidate per (year matches, title matches) tier, in a single pass.
+        # Year narrows first, then exact title, as long as the narrowed set is non-empty.
         title_lower = title.lower()
-        exact_title = [c for c in candidates if c.get(title_key, "").lower() == title_lower]
-        if exact_title:
-            candidates = exact_title
-
-        candidates.sort(key=lambda x: x.get("popularity", 0), reverse=True)
-        return candidates[0] if candidates else None
+        best: dict[tuple[bool, bool], dict] = {}
+        for candidate in candidates:
+            tier = (
+                bool(year) and candidate.get(date_key, "").startswith(year),
+                candidate.get(title_key, "").lower() == title_lower,
+            )
+            current = best.get(tier)
+            if current is None or candidate.get("popularity", 0) > current.get("popularity", 0):
+                best[tier] = candidate
+
+        year_match = (True, True) in best or (True, False) in best
+        return best.get((year_match, True)) or best.get((year_match, False))
 
     def _resolve(
         self, endpoint: str, title: str, year: str | None, date_key: str, title_key: str
     ) -> tuple[int | None, str | None]:
-        cached = self._cache_get(title, year)
+        cached = self._cache_get(endpoint, title, year)
         if cached is not None:
             return cached
 
@@ -85,11 +166,11 @@ class TMDBClient:
             date = result.get(date_key, "")
             result_year = date[:4] if date else year
             logger.info(f"TMDB match '{title}': ID {tmdb_id}, year {result_year}")
-            self._cache_set(title, year, tmdb_id, result_year)
+            self._cache_set(endpoint, title, year, tmdb_id, result_year)
             return tmdb_id, result_year
 
         logger.warning(f"No TMDB match for '{title}' {year or ''}")
-        self._cache_set(title, year, None, year)
+        self._cache_set(endpoint, title, year, None, year)
         return None, year
 
     def search_movie(self, title: str, year: str | None = None) -> tuple[int | None, str | None]:
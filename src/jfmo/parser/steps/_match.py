@@ -0,0 +1,17 @@
+import re
+
+_DIGIT = re.compile(r"[0-9]")
+
+
+def cut(name: str, match: re.Match[str], replacement: str = "") -> str:
+    """Replace the matched span of name.
+
+    Equivalent to pattern.sub(replacement, name, count=1) for the match that
+    pattern.search(name) returned, without scanning the name a second time.
+    """
+    return name[: match.start()] + replacement + name[match.end() :]
+
+
+def has_digit(name: str) -> bool:
+    """Cheap gate for steps whose patterns all require a digit."""
+    return _DIGIT.search(name) is not None
@@ -2,6 +2,7 @@ import re
 
 from ..context import ParseContext
 from ..tokens import Token
+from ._match import cut
 
 _CODEC = re.compile(
     r"\b(x264|x265|H\.?264|H\.?265|HEVC|AVC|VP9|AV1)\b",
@@ -14,5 +15,5 @@ class CodecStep:
         match = _CODEC.search(ctx.working_name)
         if match:
             ctx.tokens[Token.CODEC] = match.group(1)
-            ctx.working_name = _CODEC.sub("", ctx.working_name, count=1)
+            ctx.working_name = cut(ctx.working_name, match)
         return ctx
@@ -2,12 +2,28 @@ import re
 
 from ..context import ParseContext
 from ..tokens import Token
+from ._match import cut, has_digit
 
-_EPISODE_PATTERNS = [
-    re.compile(r"[Ee]([0-9]{1,2})(-[Ee]?([0-9]{1,2}))?"),  # E01, E01-E03, E01-03
-    re.compile(r"[Ee]pisode[.\s-]*([0-9]{1,2})", re.IGNORECASE),  # Episode 1, Episode.01
-    re.compile(r"(?:^|[.\s_-])([0-9]{1,2})\.[^.]+$"),  # 01.ext — bare number before extension
-]
+# Exx markers and "Episode N" words in one scan; an Exx marker anywhere wins over the word form
+_EPISODE_MARKERS = re.compile(
+    r"[Ee](?P<marker>[0-9]{1,2})(?:-[Ee]?[0-9]{1,2})?"  # E01, E01-E03, E01-03
+    r"|(?i:[Ee]pisode)[.\s-]*(?P<word>[0-9]{1,2})"  # Episode 1, Episode.01
+)
+_BARE_NUMBER = re.compile(r"(?:^|[.\s_-])([0-9]{1,2})\.[^.]+$")  # 01.ext — bare number before extension
+
+
+def _find_episode(name: str) -> tuple[re.Match[str], str] | None:
+    word = None
+    for match in _EPISODE_MARKERS.finditer(name):
+        if match.lastgroup == "marker":
+            return match, match["marker"]
+        word = word or match
+    if word:
+        return word, word["word"]
+
+    # Last resort only: a bare trailing number is weaker evidence than any marker
+    match = _BARE_NUMBER.search(name)
+    return (match, match.group(1)) if match else None
 
 
 class EpisodeStep:
@@ -18,11 +34,13 @@ class EpisodeStep:
     """
 
     def process(self, ctx: ParseContext) -> ParseContext:
-        for pattern in _EPISODE_PATTERNS:
-            match = pattern.search(ctx.working_name)
-            if match:
-                ctx.tokens[Token.EPISODE] = f"{int(match.group(1)):02d}"
-                ctx.working_name = pattern.sub("", ctx.working_name, count=1)
-                return ctx
+        if not has_digit(ctx.working_name):  # every episode pattern needs a number
+            return ctx
+
+        found = _find_episode(ctx.working_name)
+        if found:
+            match, episode = found
+            ctx.tokens[Token.EPISODE] = episode.zfill(2)
+            ctx.working_name = cut(ctx.working_name, match)
 
         return ctx
@@ -1,14 +1,13 @@
 import os
 
+from ...utils.fs.file_ops import VIDEO_EXTENSIONS
 from ..context import ParseContext
 
-_VIDEO_EXTENSIONS = frozenset((".mkv", ".mp4", ".avi", ".mov", ".wmv", ".flv", ".m4v", ".ts", ".m2ts"))
-
 
 class ExtensionStep:
     def process(self, ctx: ParseContext) -> ParseContext:
         stem, ext = os.path.splitext(ctx.working_name)  # .mkv, .mp4, .avi, ...
-        if ext.lower() in _VIDEO_EXTENSIONS:
+        if ext.lower() in VIDEO_EXTENSIONS:
             ctx.extension = ext
             ctx.working_name = stem
         return ctx
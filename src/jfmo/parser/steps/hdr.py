@@ -2,6 +2,7 @@ import re
 
 from ..context import ParseContext
 from ..tokens import Token
+from ._match import cut
 
 _HDR = re.compile(
     r"\b(Dolby[.\s]?Vision|DoVi|HDR10\+|HDR10Plus|HDR10|HDR|DV|SDR)\b",
@@ -14,5 +15,5 @@ class HdrStep:
         match = _HDR.search(ctx.working_name)
         if match:
             ctx.tokens[Token.HDR] = match.group(1)
-            ctx.working_name = _HDR.sub("", ctx.working_name, count=1)
+            ctx.working_name = cut(ctx.working_name, match)
         return ctx
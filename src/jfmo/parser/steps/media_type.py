@@ -1,51 +1,72 @@
 import re
+from functools import lru_cache
 
 from ..context import MediaType, ParseContext
 
-_DEFINITIVE_TV_PATTERNS = [
-    re.compile(r"S[0-9]{1,2}E[0-9]{1,2}", re.IGNORECASE),  # S01E01
-    re.compile(r"S[0-9]{1,2}\.E[0-9]{1,2}", re.IGNORECASE),  # S01.E01
-    re.compile(r"\bs[0-9]{1,2}e[0-9]{1,2}\b"),  # s01e01 (word boundary)
-    re.compile(r"S[0-9]{1,2}E[0-9]{1,2}-E?[0-9]{1,2}", re.IGNORECASE),  # S01E01-E02, S01E01-02
-    re.compile(r"[0-9]{1,2}[xX][0-9]{1,2}"),  # 3x07, 3X07
-]
+# Patterns are written in lowercase: names are lowercased once before matching
 
-_AMBIGUOUS_PATTERNS = [
-    (re.compile(r"[Ee]pisode[. ]([0-9]{1,2})", re.IGNORECASE), "Episode X format"),  # Episode 3
-    (re.compile(r"(?<![0-9])([0-9]{1})([0-9]{2})(?![0-9])"), "Combined season/episode (NNN)"),  # 308 → S03E08
-    (re.compile(r"(19|20)[0-9]{2}[.-][0-9]{2}[.-][0-9]{2}"), "Date-based format"),  # 2024.01.15
-]
+# Single alternation so the name is scanned once; also covers s01e01 and S01E01-E02
+_DEFINITIVE_TV = re.compile(
+    r"s[0-9]{1,2}\.?e[0-9]{1,2}"  # S01E01, S01.E01
+    r"|[0-9]{1,2}x[0-9]{1,2}"  # 3x07, 3X07
+)
+
+# All ambiguous shapes in one scan; each named group is one shape.
+# Zero-width lookaheads consume nothing, so a date cannot hide an adjacent NNN (2024.01.150).
+_AMBIGUOUS = re.compile(
+    r"(?=(?P<episode>episode[. ][0-9]{1,2}))"  # Episode 3
+    r"|(?=(?P<combined>(?<![0-9])[0-9][0-9]{2}(?![0-9])))"  # 308 → S03E08
+    r"|(?=(?P<date>(?:19|20)[0-9]{2}[.-][0-9]{2}[.-][0-9]{2}))"  # 2024.01.15
+)
+
+# Reported in priority order when several shapes are present
+_AMBIGUOUS_REASONS = (
+    ("episode", "Episode X format"),
+    ("combined", "Combined season/episode (NNN)"),
+    ("date", "Date-based format"),
+)
 
 _MOVIE_WITH_QUALITY = re.compile(  # year + quality → likely movie, not episode
-    r"(19|20)[0-9]{2}.*\b(720|1080|2160)p\b", re.IGNORECASE
+    r"(19|20)[0-9]{2}.*\b(720|1080|2160)p\b"
 )
 
 
-def _has_definitive_tv(name: str) -> bool:
-    return any(p.search(name) for p in _DEFINITIVE_TV_PATTERNS)
+def _ambiguous_reason(name: str) -> str:
+    """Check a name with no definitive TV marker against the ambiguous patterns."""
+    found = {match.lastgroup for match in _AMBIGUOUS.finditer(name)}
+    if "combined" in found and _MOVIE_WITH_QUALITY.search(name):
+        found.discard("combined")
+    for group, reason in _AMBIGUOUS_REASONS:
+        if group in found:
+            return reason
+    return ""
 
 
-def _is_ambiguous(name: str) -> tuple[bool, str]:
-    if _has_definitive_tv(name):
-        return False, ""
-    for pattern, reason in _AMBIGUOUS_PATTERNS:
-        if pattern.search(name):
-            if pattern is _AMBIGUOUS_PATTERNS[1][0] and _MOVIE_WITH_QUALITY.search(name):
-                continue
-            return True, reason
-    return False, ""
+# The daemon and re-runs see the same names again; classification only depends on the name
+@lru_cache(maxsize=4096)
+def _classify(name: str) -> tuple[bool, str]:
+    """Return (has definitive TV marker, ambiguous reason or "") for a lowercased basename."""
+    if _DEFINITIVE_TV.search(name):
+        return True, ""
+    return False, _ambiguous_reason(name)
 
 
 class MediaTypeStep:
     def process(self, ctx: ParseContext) -> ParseContext:
         # Use original filepath basename for pattern matching (working_name is already stripped)
         original = ctx.filepath.rsplit("/", 1)[-1] if "/" in ctx.filepath else ctx.filepath
+        original = original.lower()
+
+        # Most TV names carry SxxExx: one scan settles them without the ambiguous ladder
+        definitive_tv, reason = _classify(original)
+        if definitive_tv:
+            ctx.media_type = MediaType.TV
+            return ctx
 
-        ambiguous, reason = _is_ambiguous(original)
-        if ambiguous:
+        if reason:
             ctx.skip_reason = f"ambiguous pattern: {reason}"
             ctx.media_type = MediaType.AMBIGUOUS
-        elif "season" in ctx.tokens or "episode" in ctx.tokens or _has_definitive_tv(original):
+        elif "season" in ctx.tokens or "episode" in ctx.tokens:
             ctx.media_type = MediaType.TV
         else:
             ctx.media_type = MediaType.MOVIE
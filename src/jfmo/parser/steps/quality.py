@@ -1,27 +1,41 @@
 import re
+from functools import lru_cache
 
 from ..context import ParseContext
 from ..tokens import Token
 
-_STANDARD = re.compile(r"(480|720|1080|2160|4320)p", re.IGNORECASE)  # 720p, 1080p, 2160p, 4320p
-
-_RESOLUTION_MAP = [
-    (re.compile(r"1920\s*[xX]\s*1080"), "1080p"),  # 1920x1080
-    (re.compile(r"1280\s*[xX]\s*720"), "720p"),  # 1280x720
-    (re.compile(r"3840\s*[xX]\s*2160"), "2160p"),  # 3840x2160
-    (re.compile(r"7680\s*[xX]\s*4320"), "4320p"),  # 7680x4320
-    (re.compile(r"720\s*[xX]\s*480"), "480p"),  # 720x480
-    (re.compile(r"720\s*[xX]\s*576"), "576p"),  # 720x576
-]
-
-_HD_LABELS = [
-    (re.compile(r"\bSD\b", re.IGNORECASE), "480p"),  # SD
-    (re.compile(r"\bFHD\b", re.IGNORECASE), "1080p"),  # FHD
-    (re.compile(r"\bQHD\b", re.IGNORECASE), "1440p"),  # QHD
-    (re.compile(r"\bUHD\b|\b4K\b", re.IGNORECASE), "2160p"),  # UHD, 4K
-    (re.compile(r"\b8K\b", re.IGNORECASE), "4320p"),  # 8K
-    (re.compile(r"\bHD\b", re.IGNORECASE), "720p"),  # HD
-]
+# Every known marker in one scan, one group per marker in priority order:
+# standard NNNp first, then known resolutions, then HD labels.
+_QUALITY = re.compile(
+    r"((?:480|720|1080|2160|4320)[pP])"  # 720p, 1080p, 2160p, 4320p
+    r"|(?:"
+    r"(1920\s*[xX]\s*1080)"  # 1920x1080
+    r"|(1280\s*[xX]\s*720)"  # 1280x720
+    r"|(3840\s*[xX]\s*2160)"  # 3840x2160
+    r"|(7680\s*[xX]\s*4320)"  # 7680x4320
+    r"|(720\s*[xX]\s*480)"  # 720x480
+    r")(?![pP])"  # a glued 1920x1080p leaves its 1080p to the standard group, as written
+    r"|(720\s*[xX]\s*576)"  # 720x576 — 576p is not a standard marker, so it may be glued
+    r"|\b(?i:(sd)|(fhd)|(qhd)|(uhd|4k)|(8k)|(hd))\b"  # SD, FHD, QHD, UHD/4K, 8K, HD
+)
+_QUALITY_BY_GROUP = (  # by group number - 1
+    None,  # NNNp: reported as matched
+    "1080p",  # 1920x1080
+    "720p",  # 1280x720
+    "2160p",  # 3840x2160
+    "4320p",  # 7680x4320
+    "480p",  # 720x480
+    "576p",  # 720x576
+    "480p",  # SD
+    "1080p",  # FHD
+    "1440p",  # QHD
+    "2160p",  # UHD, 4K
+    "4320p",  # 8K
+    "720p",  # HD
+)
+
+# Fallback only: as part of _QUALITY it would swallow a trailing NNNp (1280x1080p)
+_CUSTOM_RESOLUTION = re.compile(r"[0-9]{3,4}[xX][0-9]{3,4}")  # any other WxH
 
 # Strips quality marker and everything after it (residual audio tags, language codes, etc.)
 _QUALITY_AND_TAIL = re.compile(
@@ -33,28 +47,34 @@ _QUALITY_AND_TAIL = re.compile(
 
 
 def _detect_quality(name: str) -> str:
-    match = _STANDARD.search(name)
-    if match:
-        return f"[{match.group(0)}]"
-
-    for pattern, quality in _RESOLUTION_MAP:
-        if pattern.search(name):
-            return f"[{quality}]"
+    best = 0
+    for match in _QUALITY.finditer(name):
+        if match.lastindex == 1:  # a standard marker wins outright, first one in the name
+            return f"[{match.group(1)}]"
+        if not best or match.lastindex < best:
+            best = match.lastindex
+    if best:
+        return f"[{_QUALITY_BY_GROUP[best - 1]}]"
 
-    for pattern, quality in _HD_LABELS:
-        if pattern.search(name):
-            return f"[{quality}]"
-
-    if re.search(r"[0-9]{3,4}x[0-9]{3,4}", name, re.IGNORECASE):
+    if _CUSTOM_RESOLUTION.search(name):
         return "[custom]"
 
     return ""
 
 
+# Episodes of a season reach this step with the same leftover name once SxxExx is cut
+@lru_cache(maxsize=1024)
+def _split_quality(name: str) -> tuple[str, str]:
+    """Return (quality token or "", name with the quality marker and its tail removed)."""
+    quality = _detect_quality(name)
+    if not quality:
+        return "", name
+    return quality, _QUALITY_AND_TAIL.sub("", name)
+
+
 class QualityStep:
     def process(self, ctx: ParseContext) -> ParseContext:
-        quality = _detect_quality(ctx.working_name)
+        quality, ctx.working_name = _split_quality(ctx.working_name)
         if quality:
             ctx.tokens[Token.QUALITY] = quality
-            ctx.working_name = _QUALITY_AND_TAIL.sub("", ctx.working_name)
         return ctx
@@ -2,25 +2,36 @@ import re
 
 from ..context import ParseContext
 from ..tokens import Token
+from ._match import cut
 
-# Season+episode patterns — extract only season, leave episode marker for EpisodeStep
-_SEASON_EPISODE_PATTERNS = [
-    (
-        re.compile(r"[Ss]([0-9]{1,2})[Ee]([0-9]{1,2})-[Ee]?([0-9]{1,2})"),  # S01E01-E03, S01E01-03
-        lambda m: f"E{m.group(2)}-E{m.group(3)}",  # → E01-E03
-    ),
-    (
-        re.compile(r"[Ss]([0-9]{1,2})\.?[Ee]([0-9]{1,2})"),  # S01E05, S01.E01, s01e01
-        lambda m: f"E{m.group(2)}",  # → E05
-    ),
-    (
-        re.compile(r"(?<![0-9])([0-9]{1,2})[xX]([0-9]{1,2})(?![0-9])"),  # 3x07
-        lambda m: f"E{m.group(2)}",  # → E07
-    ),
-]
+# Season+episode patterns — extract only season, leave episode marker for EpisodeStep.
+# S01E05, s01e01 and the S01E01-E03 / S01E01-03 range in one scan; the dotted S01.E01 never takes a range.
+_SEASON_EPISODE = re.compile(
+    r"[Ss](?P<season>[0-9]{1,2})"
+    r"(?:[Ee](?P<episode>[0-9]{1,2})(?:-[Ee]?(?P<last>[0-9]{1,2}))?"  # S01E05, S01E01-E03, S01E01-03
+    r"|\.[Ee](?P<dotted>[0-9]{1,2}))"  # S01.E01
+)
+_NXN = re.compile(r"(?<![0-9])([0-9]{1,2})[xX]([0-9]{1,2})(?![0-9])")  # 3x07
 
 _SEASON_ONLY = re.compile(r"\b[Ss]([0-9]{1,2})\b")  # S01, s1 — standalone season
 
+# Every pattern above contains one of these; names without any (most movies) skip them all
+_SEASON_HINT = re.compile(r"[Ss][0-9]|[0-9][xX][0-9]")
+
+
+def _find_season_episode(name: str) -> tuple[re.Match[str], str, str] | None:
+    """Return (match, season, Exx replacement); a range anywhere wins over a plain SxxExx."""
+    plain = None
+    for match in _SEASON_EPISODE.finditer(name):
+        if match["last"]:
+            return match, match["season"], f"E{match['episode']}-E{match['last']}"  # → E01-E03
+        plain = plain or match
+    if plain:
+        return plain, plain["season"], f"E{plain['episode'] or plain['dotted']}"  # → E05
+
+    match = _NXN.search(name)
+    return (match, match.group(1), f"E{match.group(2)}") if match else None  # → E07
+
 
 class SeasonStep:
     """Extract season from combined SxxExx patterns.
@@ -30,18 +41,21 @@ class SeasonStep:
     """
 
     def process(self, ctx: ParseContext) -> ParseContext:
-        for pattern, replacement in _SEASON_EPISODE_PATTERNS:
-            match = pattern.search(ctx.working_name)
-            if match:
-                ctx.tokens[Token.SEASON] = f"{int(match.group(1)):02d}"
-                ctx.working_name = pattern.sub(replacement(match), ctx.working_name, count=1)
-                return ctx
+        if not _SEASON_HINT.search(ctx.working_name):
+            return ctx
+
+        found = _find_season_episode(ctx.working_name)
+        if found:
+            match, season, replacement = found
+            ctx.tokens[Token.SEASON] = season.zfill(2)
+            ctx.working_name = cut(ctx.working_name, match, replacement)
+            return ctx
 
         # Standalone season (e.g. directory name "Breaking.Bad.S02")
         if Token.SEASON not in ctx.tokens:
             match = _SEASON_ONLY.search(ctx.working_name)
             if match:
-                ctx.tokens[Token.SEASON] = f"{int(match.group(1)):02d}"
+                ctx.tokens[Token.SEASON] = match.group(1).zfill(2)
                 ctx.working_name = _SEASON_ONLY.sub("", ctx.working_name)
 
         return ctx
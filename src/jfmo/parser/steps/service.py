@@ -2,6 +2,7 @@ import re
 
 from ..context import ParseContext
 from ..tokens import Token
+from ._match import cut
 
 _SERVICE = re.compile(
     r"\b(NF|AMZN|DSNP|HMAX|ATVP|PCOK|PMTP|iT|STAN|CRAV|MA)\b",
@@ -13,5 +14,5 @@ class ServiceStep:
         match = _SERVICE.search(ctx.working_name)
         if match:
             ctx.tokens[Token.SERVICE] = match.group(1)
-            ctx.working_name = _SERVICE.sub("", ctx.working_name, count=1)
+            ctx.working_name = cut(ctx.working_name, match)
         return ctx
@@ -2,6 +2,7 @@ import re
 
 from ..context import ParseContext
 from ..tokens import Token
+from ._match import cut
 
 _SOURCE = re.compile(
     r"\b(WEB-DL|WEBDL|WEB-?Rip|WEBRip|BluRay|BDRip|BRRip|DVDRip|HDTV|PDTV|SDTV|CAM|TS|TC|SCR|R5|DVDScr)\b",
@@ -14,5 +15,5 @@ class SourceStep:
         match = _SOURCE.search(ctx.working_name)
         if match:
             ctx.tokens[Token.SOURCE] = match.group(1)
-            ctx.working_name = _SOURCE.sub("", ctx.working_name, count=1)
+            ctx.working_name = cut(ctx.working_name, match)
         return ctx
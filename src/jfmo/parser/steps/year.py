@@ -5,25 +5,33 @@ from ..context import ParseContext
 from ..tokens import Token
 
 _YEAR_PATTERN = re.compile(r"\b(19\d{2}|20\d{2})\b")  # 1900–2099
-_CURRENT_YEAR = datetime.now().year
+# Latest plausible year as a string: same-width digit strings compare like numbers, no int() per match
+_MAX_YEAR = str(datetime.now().year + 1)
 
 
-def _detect_year(name: str) -> str:
-    matches = _YEAR_PATTERN.findall(name)
-    for match in matches:
-        if int(match) <= _CURRENT_YEAR + 1:
-            return match
-    return ""
+def _extract_year(name: str) -> tuple[str, str]:
+    """Find the first plausible year and strip every occurrence of it in one scan.
 
+    Returns (year, name without it); year is "" when none was found.
+    """
+    found = ""
 
-def _remove_year(name: str, year: str) -> str:
-    return re.sub(rf"\b{year}\b", "", name)
+    def _strip(match: re.Match[str]) -> str:
+        nonlocal found
+        candidate = match.group(1)
+        if not found and candidate <= _MAX_YEAR:
+            found = candidate
+        # Matches before the first plausible year are future years, so never equal to it
+        return "" if candidate == found else candidate
+
+    stripped = _YEAR_PATTERN.sub(_strip, name)
+    return found, stripped
 
 
 class YearStep:
     def process(self, ctx: ParseContext) -> ParseContext:
-        year = _detect_year(ctx.working_name)
+        year, stripped = _extract_year(ctx.working_name)
         if year:
             ctx.tokens[Token.YEAR] = year
-            ctx.working_name = _remove_year(ctx.working_name, year)
+            ctx.working_name = stripped
         return ctx
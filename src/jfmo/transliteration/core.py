@@ -1,9 +1,10 @@
 import math
 import pickle
+import threading
 from collections import Counter, defaultdict
+from collections.abc import Callable
 from importlib.resources import as_file, files
 
-import transliterate
 from loguru import logger
 
 from ..exceptions import TransliterationModelError
@@ -47,26 +48,43 @@ class Transliterator:
     _model_ru: NgramModel
     _model_en: NgramModel
     _models_loaded: bool = False
+    _translit_ru: Callable[[str], str] | None = None
+    # Run workers reach the lazy loads together on the first batch; only one of them loads
+    _load_lock = threading.Lock()
 
     @classmethod
     def _load_models(cls) -> None:
         if cls._models_loaded:
             return
 
-        try:
-            pkg = files("jfmo.transliteration.models")
-            with (
-                as_file(pkg.joinpath("jfmo_russian_model.pkl")) as path_ru,
-                as_file(pkg.joinpath("jfmo_english_model.pkl")) as path_en,
-            ):
-                cls._model_ru = NgramModel.load(path_ru)
-                cls._model_en = NgramModel.load(path_en)
-            cls._model_ru.probability("test")
-            cls._model_en.probability("test")
-            cls._models_loaded = True
-            logger.info("Language models loaded and validated successfully")
-        except Exception as e:
-            raise TransliterationModelError(f"Failed to load language models: {e}") from e
+        with cls._load_lock:
+            if cls._models_loaded:
+                return
+            try:
+                pkg = files("jfmo.transliteration.models")
+                with (
+                    as_file(pkg.joinpath("jfmo_russian_model.pkl")) as path_ru,
+                    as_file(pkg.joinpath("jfmo_english_model.pkl")) as path_en,
+                ):
+                    cls._model_ru = NgramModel.load(path_ru)
+                    cls._model_en = NgramModel.load(path_en)
+                cls._model_ru.probability("test")
+                cls._model_en.probability("test")
+                cls._models_loaded = True
+                logger.info("Language models loaded and validated successfully")
+            except Exception as e:
+                raise TransliterationModelError(f"Failed to load language models: {e}") from e
+
+    @classmethod
+    def _get_translit_ru(cls) -> Callable[[str], str]:
+        # transliterate.translit looks up and rebuilds the language pack on every call
+        if cls._translit_ru is None:
+            with cls._load_lock:
+                if cls._translit_ru is None:
+                    from transliterate import get_translit_function  # deferred: only Russian-looking names need it
+
+                    cls._translit_ru = get_translit_function("ru")
+        return cls._translit_ru
 
     @classmethod
     def is_possibly_russian(cls, name: str) -> bool:
@@ -77,12 +95,13 @@ class Transliterator:
 
     @classmethod
     def transliterate_text(cls, text: str) -> str:
-        if any(ord(c) > 127 for c in text) or not text:
+        if not text or not text.isascii():  # already non-Latin (or empty): nothing to transliterate
             return text
         if not cls.is_possibly_russian(text):
             return text
+
         try:
-            result = transliterate.translit(text, "ru")
+            result = cls._get_translit_ru()(text)
             if result != text:
                 logger.info(f"Transliterated: {text} → {result}")
                 return result
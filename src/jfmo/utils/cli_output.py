@@ -8,43 +8,49 @@ if TYPE_CHECKING:
 _WIDTH = 51
 _DIVIDER = "  " + "─" * _WIDTH
 
+_INNER = _WIDTH - 2  # space inside box borders
+_DRY_RUN_BANNER = (
+    "┌" + "─" * _INNER + "┐",
+    "│" + "DRY RUN MODE".center(_INNER) + "│",
+    "│" + "No files will be modified".center(_INNER) + "│",
+    "└" + "─" * _INNER + "┘",
+    "",
+)
+
+
+def _emit(*lines: str) -> None:
+    """Write a block of lines with a single write call."""
+    print("\n".join(lines))
+
 
 def print_dry_run_banner() -> None:
-    inner = _WIDTH - 2  # space inside box borders
-    title = "DRY RUN MODE"
-    sub = "No files will be modified"
-    print("┌" + "─" * inner + "┐")
-    print("│" + title.center(inner) + "│")
-    print("│" + sub.center(inner) + "│")
-    print("└" + "─" * inner + "┘")
-    print()
+    _emit(*_DRY_RUN_BANNER)
 
 
 def print_header(count: int) -> None:
     noun = "entry" if count == 1 else "entries"
-    print(f"Processing {count} {noun}...")
-    print()
+    _emit(f"Processing {count} {noun}...", "")
 
 
 def print_entry_header(name: str, *, is_dir: bool) -> None:
     kind = "directory" if is_dir else "file"
-    print(f"  \u25b6 {name} ({kind})")
-    print()
+    _emit(f"  \u25b6 {name} ({kind})", "")
 
 
 def print_result(r: ProcessResult) -> None:
     tick = "\u2713" if r.success else "\u2717"
-    print(f"  {r.media_kind.value:<6} {r.source}")
-    print(f"         \u2192 {r.dest}  {tick}")
-    print()
+    _emit(
+        f"  {r.media_kind.value:<6} {r.source}",
+        f"         \u2192 {r.dest}  {tick}",
+        "",
+    )
 
 
 def print_summary(results: list[ProcessResult], skipped: int, dry_run: bool) -> None:
-    print(_DIVIDER)
-    linked = sum(1 for r in results if r.success)
-    failed = sum(1 for r in results if not r.success)
+    linked = sum(r.success for r in results)
+    failed = len(results) - linked
     if dry_run:
-        print(f"  {linked} would link  |  {skipped} skipped  |  {failed} failed")
+        counts = f"  {linked} would link  |  {skipped} skipped  |  {failed} failed"
     else:
-        print(f"  {linked} linked  |  {skipped} skipped  |  {failed} failed")
-    print()
+        counts = f"  {linked} linked  |  {skipped} skipped  |  {failed} failed"
+    _emit(_DIVIDER, counts, "")
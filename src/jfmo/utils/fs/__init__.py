@@ -1,4 +1,4 @@
-from .file_ops import ensure_dir, is_video_file, link_file
+from .file_ops import ensure_dir, is_video_file, iter_media_entries, iter_video_dirs, link_file
 from .file_stability_tracker import FileStabilityTracker
 
-__all__ = ["FileStabilityTracker", "ensure_dir", "is_video_file", "link_file"]
+__all__ = ["FileStabilityTracker", "ensure_dir", "is_video_file", "iter_media_entries", "iter_video_dirs", "link_file"]
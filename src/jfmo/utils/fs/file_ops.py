@@ -1,17 +1,58 @@
 import os
+from collections.abc import Iterator
 from pathlib import Path
 
 from loguru import logger
 
-VIDEO_EXTENSIONS = (".mkv", ".mp4", ".avi", ".mov", ".wmv", ".flv", ".m4v", ".ts", ".m2ts")
+VIDEO_EXTENSIONS = frozenset((".mkv", ".mp4", ".avi", ".mov", ".wmv", ".flv", ".m4v", ".ts", ".m2ts"))
 
 
 def is_video_file(filename: str) -> bool:
-    return filename.lower().endswith(VIDEO_EXTENSIONS)
+    return os.path.splitext(filename)[1].lower() in VIDEO_EXTENSIONS
+
+
+def iter_media_entries(directory: str) -> Iterator[os.DirEntry]:
+    """Yield direct children of directory that are subdirectories or video files."""
+    with os.scandir(directory) as it:
+        for entry in it:
+            # Extension check first: it rejects .nfo/.srt/.txt without asking for the file type
+            if (is_video_file(entry.name) and entry.is_file()) or entry.is_dir():
+                yield entry
+
+
+def iter_video_dirs(top: str) -> Iterator[tuple[str, list[os.DirEntry]]]:
+    """Walk top-down from top, yielding each directory with its video file entries.
+
+    Like os.walk, symlinked directories are not followed and unreadable ones are skipped.
+    """
+    stack = [top]
+    while stack:
+        dirpath = stack.pop()
+        subdirs: list[str] = []
+        videos: list[os.DirEntry] = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif is_video_file(entry.name) and entry.is_file():
+                        videos.append(entry)
+        except OSError:
+            continue
+        yield dirpath, videos
+        stack.extend(reversed(subdirs))  # reversed so subdirectories are visited in listing order
+
+
+# Directories seen to exist, so each show/season folder is stat-ed once per process.
+# link_file drops an entry again if the folder disappears under a long-running daemon.
+_ensured_dirs: set[str] = set()
 
 
 def ensure_dir(directory: str, dry_run: bool = False) -> bool:
+    if directory in _ensured_dirs:
+        return True
     if os.path.exists(directory):
+        _ensured_dirs.add(directory)
         return True
 
     if dry_run:
@@ -20,6 +61,7 @@ def ensure_dir(directory: str, dry_run: bool = False) -> bool:
 
     try:
         Path(directory).mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(directory)
         logger.info(f"Created directory: {directory}")
         return True
     except PermissionError as e:
@@ -43,17 +85,23 @@ def link_file(source_file: str, dest_file: str, dry_run: bool = False) -> bool:
         logger.info(f"DRY RUN - Would link: {source_file} -> {dest_file}")
         return True
 
-    if os.path.exists(dest_file):
-        logger.warning(f"Destination file already exists: {dest_file}")
-        try:
-            os.remove(dest_file)
-            logger.info(f"Removed existing destination file: {dest_file}")
-        except Exception as e:
-            logger.error(f"Cannot remove {dest_file}: {e}")
-            return False
-
     try:
-        os.link(source_file, dest_file)
+        try:
+            os.link(source_file, dest_file)
+        except FileExistsError:
+            # Replacing is the rare case: attempt the link instead of stat-ing dest_file first
+            logger.warning(f"Destination file already exists: {dest_file}")
+            if not _remove_existing(dest_file):
+                return False
+            os.link(source_file, dest_file)
+        except FileNotFoundError:
+            # The source was checked above, so the cached destination folder is gone
+            if not dest_dir:
+                raise
+            _ensured_dirs.discard(dest_dir)
+            if not ensure_dir(dest_dir):
+                return False
+            os.link(source_file, dest_file)
         logger.info(f"LINKED: {source_file} -> {dest_file}")
         return True
     except PermissionError as e:
@@ -62,3 +110,13 @@ def link_file(source_file: str, dest_file: str, dry_run: bool = False) -> bool:
     except OSError as e:
         logger.error(f"ERROR LINKING (os error): {source_file} -> {dest_file} ({e})")
         return False
+
+
+def _remove_existing(dest_file: str) -> bool:
+    try:
+        os.remove(dest_file)
+        logger.info(f"Removed existing destination file: {dest_file}")
+        return True
+    except Exception as e:
+        logger.error(f"Cannot remove {dest_file}: {e}")
+        return False
@@ -19,22 +19,26 @@ class FileStabilityTracker:
         self.stability_cycles = stability_cycles
         self.pending_files: dict[str, tuple[int, int]] = {}  # path -> (size, count)
 
-    def is_stable(self, filepath: str) -> bool:
+    def is_stable(self, filepath: str, size: int | None = None) -> bool:
         """
         Check if a file is stable (size unchanged for N cycles).
 
         Args:
             filepath: Path to file to check
+            size: Current file size, if the caller has already stat'ed the file
 
         Returns:
             True if file size has remained unchanged for stability_cycles scans
         """
-        try:
-            current_size = os.path.getsize(filepath)
-        except OSError:
-            # File deleted or inaccessible
-            self.pending_files.pop(filepath, None)
-            return False
+        if size is not None:
+            current_size = size
+        else:
+            try:
+                current_size = os.path.getsize(filepath)
+            except OSError:
+                # File deleted or inaccessible
+                self.pending_files.pop(filepath, None)
+                return False
 
         last_size, count = self.pending_files.get(filepath, (None, 0))
 
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 # Matches a delimited segment that still contains an un-substituted {token}
 _BRACKETED_WITH_TOKEN = re.compile(
@@ -16,19 +17,39 @@ _DASH_SEGMENT_WITH_TOKEN = re.compile(
     r"\s*-\s*\{[^}]+\}"
 )
 
+_PLACEHOLDER = re.compile(r"\{([^}]+)\}")  # {title} → title
+_LEFTOVER_TOKEN = re.compile(r"\{[^}]+\}")  # any {token} left without a value
+_TRAILING_DASH = re.compile(r"\s*-\s*$")
+_LEADING_DASH = re.compile(r"^\s*-\s*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=32)
+def _placeholders(pattern: str) -> tuple[str, ...]:
+    """Token names used by a naming pattern, parsed once per distinct pattern."""
+    return tuple(dict.fromkeys(_PLACEHOLDER.findall(pattern)))
+
 
 def format_tokens(pattern: str, tokens: dict[str, str]) -> str:
+    # Keyed on just the values the pattern uses: folder names repeat for every episode of a season
+    values = tuple("" if (value := tokens.get(key)) is None else str(value) for key in _placeholders(pattern))
+    return _format(pattern, values)
+
+
+@lru_cache(maxsize=256)
+def _format(pattern: str, values: tuple[str, ...]) -> str:
     result = pattern
 
-    for key, value in tokens.items():
-        if value is not None and str(value) != "":
-            result = result.replace(f"{{{key}}}", str(value))
+    # Only visit the tokens the pattern actually uses, not every parsed token
+    for key, value in zip(_placeholders(pattern), values, strict=True):
+        if value:
+            result = result.replace(f"{{{key}}}", value)
 
     result = _BRACKETED_WITH_TOKEN.sub("", result)
     result = _DASH_SEGMENT_WITH_TOKEN.sub("", result)
-    result = re.sub(r"\{[^}]+\}", "", result)
+    result = _LEFTOVER_TOKEN.sub("", result)
 
-    result = re.sub(r"\s*-\s*$", "", result)
-    result = re.sub(r"^\s*-\s*", "", result)
-    result = re.sub(r"\s+", " ", result)
+    result = _TRAILING_DASH.sub("", result)
+    result = _LEADING_DASH.sub("", result)
+    result = _WHITESPACE.sub(" ", result)
     return result.strip()
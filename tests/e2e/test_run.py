@@ -0,0 +1,66 @@
+import pytest
+
+from jfmo import _run
+from jfmo.config import config
+from jfmo.formatter import Formatter
+from jfmo.metadata.tmdb import TMDBClient
+
+
+@pytest.fixture
+def downloads(tmp_path, media_dirs):  # noqa: ARG001
+    d = tmp_path / "downloads"
+    d.mkdir()
+    config.DOWNLOADS_DIR = str(d)
+    config.WORKERS = 2
+
+    (d / "Inception.2010.1080p.mkv").write_bytes(b"\x00" * 1024)
+    (d / "Show.Episode 3.mkv").write_bytes(b"\x00" * 1024)  # ambiguous → skipped
+    (d / "notes.txt").write_text("not a video")
+    season = d / "Severance.S01.1080p"
+    season.mkdir()
+    for ep in (1, 2, 3):
+        (season / f"Severance.S01E0{ep}.1080p.mkv").write_bytes(b"\x00" * 1024)
+    return d
+
+
+def test_run_apply_links_files_and_directories(downloads, media_dirs, capsys):  # noqa: ARG001
+    movies, tv = media_dirs
+
+    _run(apply=True)
+
+    assert [p.name for p in movies.iterdir()] == ["Inception (2010) - [1080p].mkv"]
+    assert len(list(tv.rglob("*.mkv"))) == 3
+    assert "4 linked  |  1 skipped  |  0 failed" in capsys.readouterr().out
+
+
+def test_run_prints_results_under_their_entry(downloads, media_dirs, capsys):  # noqa: ARG001
+    _run(apply=False)
+
+    out = capsys.readouterr().out
+    assert "▶ Inception.2010.1080p.mkv (file)\n\n  Movie  Inception.2010.1080p.mkv\n" in out
+    assert "4 would link  |  1 skipped  |  0 failed" in out
+
+
+def test_run_dry_run_links_nothing(downloads, media_dirs):  # noqa: ARG001
+    movies, tv = media_dirs
+
+    _run(apply=False)
+
+    assert list(movies.iterdir()) == []
+    assert list(tv.iterdir()) == []
+
+
+@pytest.mark.usefixtures("downloads", "media_dirs")
+def test_run_saves_tmdb_cache_when_interrupted(monkeypatch):
+    saved = []
+    monkeypatch.setattr(TMDBClient, "save_cache", lambda _self: saved.append(True))
+
+    def broken_format_file(_self, _path):
+        raise RuntimeError("formatter failed")
+
+    monkeypatch.setattr(Formatter, "format_file", broken_format_file)
+
+    with pytest.raises(RuntimeError):
+        _run(apply=False)
+
+    assert saved == [True]
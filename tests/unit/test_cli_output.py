@@ -0,0 +1,35 @@
+from jfmo.processors.result import MediaKind, ProcessResult
+from jfmo.utils.cli_output import print_dry_run_banner, print_entry_header, print_result, print_summary
+
+
+def _result(success: bool = True) -> ProcessResult:
+    return ProcessResult(source="Show.S01E01.mkv", dest="Show S01E01.mkv", media_kind=MediaKind.TV, success=success)
+
+
+def test_dry_run_banner(capsys):
+    print_dry_run_banner()
+    lines = capsys.readouterr().out.split("\n")
+    assert lines[0] == "┌" + "─" * 49 + "┐"
+    assert lines[1] == "│" + "DRY RUN MODE".center(49) + "│"
+    assert lines[4:] == ["", ""]
+
+
+def test_entry_header(capsys):
+    print_entry_header("Show.S01", is_dir=True)
+    assert capsys.readouterr().out == "  ▶ Show.S01 (directory)\n\n"
+
+
+def test_result_block(capsys):
+    print_result(_result())
+    assert capsys.readouterr().out == "  TV     Show.S01E01.mkv\n         → Show S01E01.mkv  ✓\n\n"
+
+
+def test_summary_counts(capsys):
+    print_summary([_result(), _result(), _result(success=False)], skipped=4, dry_run=False)
+    out = capsys.readouterr().out
+    assert "2 linked  |  4 skipped  |  1 failed" in out
+
+
+def test_summary_dry_run(capsys):
+    print_summary([_result()], skipped=0, dry_run=True)
+    assert "1 would link  |  0 skipped  |  0 failed" in capsys.readouterr().out
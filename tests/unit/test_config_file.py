@@ -93,6 +93,23 @@ def test_load_tmdb_empty_key_not_overwritten(tmp_path):
     assert config.TMDB_API_KEY == "existing"
 
 
+@pytest.mark.parametrize("value, expected", [("/tmp/jfmo/tmdb.json", "/tmp/jfmo/tmdb.json"), ("", None)])
+def test_load_tmdb_cache_file(tmp_path, value, expected):
+    data = _base_data(tmp_path)
+    data["tmdb"] = {"cache_file": value}
+    cfg = tmp_path / "config.yaml"
+    write_yaml(cfg, data)
+    config.load(str(cfg))
+    assert expected == config.TMDB_CACHE_FILE
+
+
+def test_tmdb_cache_file_disabled_by_default(tmp_path):
+    cfg = tmp_path / "config.yaml"
+    write_yaml(cfg, _base_data(tmp_path))
+    config.load(str(cfg))
+    assert config.TMDB_CACHE_FILE is None
+
+
 # ---------------------------------------------------------------------------
 # load — logging
 # ---------------------------------------------------------------------------
@@ -203,3 +220,26 @@ def test_validate_missing_directories(tmp_path):
     write_yaml(cfg, data)
     with pytest.raises(ValueError, match="Directory does not exist"):
         config.load(str(cfg))
+
+
+# ---------------------------------------------------------------------------
+# load — processing
+# ---------------------------------------------------------------------------
+
+
+def test_load_processing_workers(tmp_path):
+    data = _base_data(tmp_path)
+    data["processing"] = {"workers": 8}
+    cfg = tmp_path / "config.yaml"
+    write_yaml(cfg, data)
+    config.load(str(cfg))
+    assert config.WORKERS == 8
+
+
+def test_load_processing_workers_too_low(tmp_path):
+    data = _base_data(tmp_path)
+    data["processing"] = {"workers": 0}
+    cfg = tmp_path / "config.yaml"
+    write_yaml(cfg, data)
+    with pytest.raises(ValueError, match="processing.workers must be >= 1"):
+        config.load(str(cfg))
@@ -55,6 +55,32 @@ class TestFileWatcher:
         watcher._process_pending_entry(video_path)
         formatter.format_file.assert_called_once_with(video_path)
 
+    def test_stable_entries_processed_on_worker_pool(self, watch_dir, formatter):
+        formatter.format_file.return_value = True
+        watcher = FileWatcher(str(watch_dir), 0, formatter, workers=2)
+
+        for name in ("a.mkv", "b.mkv"):
+            (watch_dir / name).write_bytes(b"data")
+        watcher.pending_entries = watcher._scan_entries()
+        for path in watcher.pending_entries:
+            for _ in range(3):
+                watcher.stability_tracker.is_stable(path)
+        # Stop the watch loop once the first cycle has dispatched its entries
+        formatter.format_file.side_effect = lambda _path: watcher.stop() or True
+
+        watcher.start()
+
+        assert formatter.format_file.call_count == 2
+        assert watcher.pending_entries == set()
+
+    def test_cycle_end_hook_runs_each_cycle(self, watch_dir, formatter):
+        on_cycle_end = MagicMock(side_effect=lambda: watcher.stop())
+        watcher = FileWatcher(str(watch_dir), 0, formatter, on_cycle_end=on_cycle_end)
+
+        watcher.start()
+
+        on_cycle_end.assert_called_once_with()
+
     def test_new_unstable_file_not_processed(self, watch_dir, formatter):
         """A file that just appeared should NOT be processed (not stable yet)."""
         watcher = self._make_watcher(watch_dir, formatter)
@@ -64,6 +90,49 @@ class TestFileWatcher:
         watcher._process_pending_entry(str(video))
         formatter.format_file.assert_not_called()
 
+    def test_directory_stable_once_all_videos_stable(self, watch_dir, formatter):
+        show_dir = watch_dir / "Some.Show.S01"
+        (show_dir / "Season 1").mkdir(parents=True)
+        (show_dir / "Season 1" / "episode.mkv").write_bytes(b"data")
+        (show_dir / "notes.txt").write_text("growing")
+        watcher = self._make_watcher(watch_dir, formatter)
+
+        assert watcher._stable_videos(str(show_dir), is_dir=True) is None
+        assert watcher._stable_videos(str(show_dir), is_dir=True) is None
+        assert watcher._stable_videos(str(show_dir), is_dir=True) == [str(show_dir / "Season 1" / "episode.mkv")]
+
+    def test_symlinked_directory_waits_for_growing_video(self, tmp_path, watch_dir, formatter):
+        target = tmp_path / "incoming" / "Some.Show.S01"
+        target.mkdir(parents=True)
+        video = target / "episode.mkv"
+        video.write_bytes(b"data")
+        entry = watch_dir / "Some.Show.S01"
+        entry.symlink_to(target, target_is_directory=True)
+        watcher = self._make_watcher(watch_dir, formatter)
+
+        assert watcher._process_pending_entry(str(entry)) is False
+        video.write_bytes(b"more data")  # still downloading
+        assert watcher._process_pending_entry(str(entry)) is False
+        assert watcher._process_pending_entry(str(entry)) is False
+        formatter.format_directory.assert_not_called()
+
+        assert watcher._process_pending_entry(str(entry)) is True
+        formatter.format_directory.assert_called_once_with(str(entry))
+        # Tracked under the path the formatter sees, and untracked once processed
+        assert watcher.stability_tracker.pending_files == {}
+
+    def test_symlinked_directory_videos_keyed_under_entry_path(self, tmp_path, watch_dir, formatter):
+        target = tmp_path / "incoming" / "Some.Show.S01"
+        (target / "Season 1").mkdir(parents=True)
+        (target / "Season 1" / "episode.mkv").write_bytes(b"data")
+        entry = watch_dir / "Some.Show.S01"
+        entry.symlink_to(target, target_is_directory=True)
+        watcher = self._make_watcher(watch_dir, formatter)
+
+        watcher._stable_videos(str(entry), is_dir=True)
+
+        assert list(watcher.stability_tracker.pending_files) == [str(entry / "Season 1" / "episode.mkv")]
+
     def test_unstable_entry_eventually_processed_across_cycles(self, watch_dir, formatter):
         """
         A new entry that is not yet stable should eventually be
@@ -0,0 +1,77 @@
+import shutil
+
+import pytest
+
+from jfmo.utils.fs.file_ops import is_video_file, iter_media_entries, iter_video_dirs, link_file
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ("Inception.2010.1080p.mkv", True),
+        ("Show.S01E01.MP4", True),
+        ("clip.m2ts", True),
+        ("archive.tar.ts", True),
+        ("readme.txt", False),
+        ("Show.S01E01.mkv.part", False),
+        ("mkv", False),
+        ("no_extension", False),
+    ],
+)
+def test_is_video_file(filename, expected):
+    assert is_video_file(filename) is expected
+
+
+def test_iter_media_entries(tmp_path):
+    (tmp_path / "Movie.2010.mkv").write_bytes(b"x")
+    (tmp_path / "notes.txt").write_text("x")
+    (tmp_path / "Show.S01").mkdir()
+
+    names = sorted(entry.name for entry in iter_media_entries(str(tmp_path)))
+
+    assert names == ["Movie.2010.mkv", "Show.S01"]
+
+
+def test_iter_video_dirs(tmp_path):
+    season = tmp_path / "Season 1"
+    season.mkdir()
+    (season / "Show.E01.mkv").write_bytes(b"x")
+    (season / "Show.E01.srt").write_text("x")
+    (tmp_path / "Extras").mkdir()
+    (tmp_path / "Extras" / "link").symlink_to(season)
+
+    walked = {dirpath: [entry.name for entry in videos] for dirpath, videos in iter_video_dirs(str(tmp_path))}
+
+    assert walked == {str(tmp_path): [], str(season): ["Show.E01.mkv"], str(tmp_path / "Extras"): []}
+
+
+def test_link_file_creates_hardlink(tmp_path):
+    source = tmp_path / "Movie.2010.mkv"
+    source.write_bytes(b"x")
+    dest = tmp_path / "Movies" / "Movie (2010)" / "Movie (2010).mkv"
+
+    assert link_file(str(source), str(dest)) is True
+    assert dest.stat().st_ino == source.stat().st_ino
+
+
+def test_link_file_replaces_existing_destination(tmp_path):
+    source = tmp_path / "Movie.2010.mkv"
+    source.write_bytes(b"new")
+    dest = tmp_path / "Movie (2010).mkv"
+    dest.write_bytes(b"old")
+
+    assert link_file(str(source), str(dest)) is True
+    assert dest.read_bytes() == b"new"
+    assert dest.stat().st_ino == source.stat().st_ino
+
+
+def test_link_file_recreates_removed_destination_dir(tmp_path):
+    source = tmp_path / "Show.S01E01.mkv"
+    source.write_bytes(b"x")
+    season = tmp_path / "TV" / "Show" / "Season 01"
+
+    assert link_file(str(source), str(season / "Show S01E01.mkv")) is True
+    shutil.rmtree(season)
+
+    assert link_file(str(source), str(season / "Show S01E01.mkv")) is True
+    assert (season / "Show S01E01.mkv").exists()
@@ -49,3 +49,9 @@ class TestFileStabilityTracker:
         tracker.is_stable(str(f))
         tracker.mark_processed(str(f))
         assert str(f) not in tracker.pending_files
+
+    def test_known_size_skips_stat(self, tmp_path):
+        tracker = FileStabilityTracker(stability_cycles=1)
+        path = str(tmp_path / "missing.mkv")  # never stat'ed when size is given
+        assert tracker.is_stable(path, size=100) is False
+        assert tracker.is_stable(path, size=100) is True
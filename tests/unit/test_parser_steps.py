@@ -55,6 +55,8 @@ def test_extension_step(filename, expected_stem, expected_ext):
         ("Show.S01.E01.mkv", "01", "E01"),
         ("Show.3x07.mkv", "03", "E07"),
         ("Show.S01E01-E03.mkv", "01", "E01-E03"),
+        ("Show.S01E01-03.mkv", "01", "E01-E03"),
+        ("Show.S01.E01-E03.mkv", "01", "E01-E03"),
         ("Show.S12E24.mkv", "12", "E24"),
     ],
 )
@@ -65,15 +67,30 @@ def test_season_extracts_season_leaves_episode(filename, season, leftover_episod
     assert leftover_episode in ctx.working_name
 
 
+@pytest.mark.parametrize(
+    "filename, season, working_name",
+    [
+        ("Show.S01E02.S03E04-E05.mkv", "03", "Show.S01E02.E04-E05.mkv"),  # a range anywhere wins
+        ("Show.S01.E03-30.mkv", "01", "Show.E03-30.mkv"),  # dotted form is never a range
+    ],
+)
+def test_season_range_precedence(filename, season, working_name):
+    ctx = SeasonStep().process(_ctx(filename))
+    assert ctx.tokens[Token.SEASON] == season
+    assert ctx.working_name == working_name
+
+
 def test_season_removes_season_marker_from_working_name():
     ctx = SeasonStep().process(_ctx("The.Office.S03E07.720p"))
     assert "S03" not in ctx.working_name
     assert "s03" not in ctx.working_name.lower().replace("e07", "")
 
 
-def test_season_not_detected():
-    ctx = SeasonStep().process(_ctx("Inception.2010.1080p.mkv"))
+@pytest.mark.parametrize("filename", ["Inception.2010.1080p.mkv", "Dune.2021.2160p.x265.mkv", "Movie.1920x1080"])
+def test_season_not_detected(filename):
+    ctx = SeasonStep().process(_ctx(filename))
     assert Token.SEASON not in ctx.tokens
+    assert ctx.working_name == filename
 
 
 def test_standalone_season():
@@ -97,6 +114,24 @@ def test_episode_from_season_step_leftover():
     assert "E05" not in ctx.working_name
 
 
+@pytest.mark.parametrize(
+    "working_name, episode, leftover",
+    [
+        ("Show.E05-E06.720p", "05", "Show..720p"),
+        ("Show.Episode.3.720p", "03", "Show..720p"),
+        ("Show.episode 12", "12", "Show."),
+        ("Show.Episode01", "01", "Show."),
+        ("Show.Episode.2.E07", "07", "Show.Episode.2."),  # Exx marker wins over the word form
+        ("Show.Episode01.E07", "07", "Show.Episode01."),  # glued word form no longer read as its "e01"
+        ("Show.07.rus", "07", "Show"),
+    ],
+)
+def test_episode_patterns(working_name, episode, leftover):
+    ctx = EpisodeStep().process(_ctx(working_name))
+    assert ctx.tokens[Token.EPISODE] == episode
+    assert ctx.working_name == leftover
+
+
 def test_episode_only_when_season_present():
     """When season comes from directory seed, detect episode-only pattern."""
     ctx = _ctx("Show.E05.mkv", season="02")
@@ -128,6 +163,18 @@ def test_year_removes_from_working_name():
     assert "2010" not in ctx.working_name
 
 
+def test_year_removes_only_detected_year():
+    ctx = YearStep().process(_ctx("Blade.Runner.2099.2017.1080p"))
+    assert ctx.tokens[Token.YEAR] == "2017"
+    assert ctx.working_name == "Blade.Runner.2099..1080p"
+
+
+def test_year_removes_every_occurrence():
+    ctx = YearStep().process(_ctx("Movie.2010.Remaster.2010.1080p"))
+    assert ctx.tokens[Token.YEAR] == "2010"
+    assert ctx.working_name == "Movie..Remaster..1080p"
+
+
 def test_year_not_detected():
     ctx = YearStep().process(_ctx("Show.S01E01.mkv"))
     assert Token.YEAR not in ctx.tokens
@@ -302,6 +349,19 @@ def test_release_group_not_detected():
         ("Movie.UHD.mkv", "[2160p]"),
         ("Movie.FHD.mkv", "[1080p]"),
         ("Movie.HD.mkv", "[720p]"),
+        ("Movie.SD.mkv", "[480p]"),
+        ("Movie.8K.mkv", "[4320p]"),
+        ("Movie.HD.UHD.mkv", "[2160p]"),  # label priority, not position
+        ("Movie.HD.1920x1080.2160p.mkv", "[2160p]"),  # NNNp beats resolutions and labels
+        ("Movie.1280x1080p.mkv", "[1080p]"),
+        ("Movie.2010.1920x1080p.BluRay.720p.mkv", "[1080p]"),  # glued NNNp is the first standard marker
+        ("Movie.2010.1920x1080P.BluRay.mkv", "[1080P]"),  # reported as written
+        ("Movie.720x480p.[1080p].mkv", "[480p]"),
+        ("Movie.720x576p.mkv", "[576p]"),
+        ("Movie.1920x1080.mkv", "[1080p]"),
+        ("Movie.720 x 576.mkv", "[576p]"),
+        ("Movie.1280x720.1920x1080.mkv", "[1080p]"),  # list order wins, not position
+        ("Movie.640x360.mkv", "[custom]"),
     ],
 )
 def test_quality_detected(filename, quality):
@@ -331,6 +391,8 @@ def test_quality_not_detected():
         ("Severance.S02E02.1080p.mkv", MediaType.TV),
         ("breaking.bad.s01e05.mkv", MediaType.TV),
         ("Show.3x07.mkv", MediaType.TV),
+        ("Show.S01.E01.mkv", MediaType.TV),
+        ("Show.3X07.mkv", MediaType.TV),
         ("Show.S01E01-E03.mkv", MediaType.TV),
         ("1923.S01E01.mkv", MediaType.TV),
         ("Inception.2010.1080p.BluRay.mkv", MediaType.MOVIE),
@@ -350,16 +412,32 @@ def test_media_type_tv_from_token():
     assert ctx.media_type == MediaType.TV
 
 
+def test_media_type_cached_name_still_uses_tokens():
+    """Name classification is cached; the season/episode token fallback is not."""
+    step = MediaTypeStep()
+    assert step.process(_ctx("Show.E05.mkv", season="02")).media_type == MediaType.TV
+    assert step.process(_ctx("Show.E05.mkv")).media_type == MediaType.MOVIE
+
+
 @pytest.mark.parametrize(
-    "filename",
+    "filename, reason",
     [
-        "Show.2024-01-15.mkv",  # date-based
+        ("Show.2024-01-15.mkv", "Date-based format"),
+        ("Show.Episode 3.mkv", "Episode X format"),
+        ("Show.308.mkv", "Combined season/episode (NNN)"),
+        ("Show.308.Episode.3.mkv", "Episode X format"),  # priority, not position
+        ("Show.2024.01.150.mkv", "Combined season/episode (NNN)"),  # date shape overlaps the NNN
     ],
 )
-def test_media_type_ambiguous(filename):
+def test_media_type_ambiguous(filename, reason):
     ctx = MediaTypeStep().process(_ctx(filename))
     assert ctx.media_type == MediaType.AMBIGUOUS
-    assert ctx.skip_reason is not None
+    assert ctx.skip_reason == f"ambiguous pattern: {reason}"
+
+
+def test_media_type_nnn_with_year_and_quality_is_movie():
+    ctx = MediaTypeStep().process(_ctx("Movie.300.2006.1080p.mkv"))
+    assert ctx.media_type == MediaType.MOVIE
 
 
 # ---------------------------------------------------------------------------
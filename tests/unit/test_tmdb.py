@@ -0,0 +1,108 @@
+import json
+from unittest.mock import ANY
+
+import pytest
+
+from jfmo.metadata import TMDBClient
+
+
+def _movie(tmdb_id, title, date, popularity):
+    return {"id": tmdb_id, "title": title, "release_date": date, "popularity": popularity}
+
+
+CANDIDATES = [
+    _movie(1, "Dune", "1984-12-14", 40.0),
+    _movie(2, "Dune: Part Two", "2024-02-27", 300.0),
+    _movie(3, "Dune", "2021-09-15", 200.0),
+    _movie(4, "Dune World", "2021-01-01", 250.0),
+]
+
+
+@pytest.mark.parametrize(
+    "title, year, expected_id",
+    [
+        ("Dune", "2021", 3),  # year, then exact title
+        ("Dune", "1984", 1),  # year match beats popularity
+        ("Dune", None, 3),  # exact title, most popular
+        ("Dune", "1999", 3),  # no year match → year filter ignored
+        ("Arrival", None, 2),  # no exact title → most popular overall
+        ("Arrival", "2021", 4),  # year match only → most popular of that year
+    ],
+)
+def test_pick_best(title, year, expected_id):
+    client = TMDBClient(None)
+    best = client._pick_best(list(CANDIDATES), title, year, "release_date", "title")
+    assert best["id"] == expected_id
+
+
+def test_pick_best_keeps_first_on_popularity_tie():
+    client = TMDBClient(None)
+    candidates = [_movie(1, "Dune", "2021-01-01", 10.0), _movie(2, "Dune", "2021-01-01", 10.0)]
+    assert client._pick_best(candidates, "Dune", None, "release_date", "title")["id"] == 1
+
+
+def test_pick_best_no_candidates():
+    assert TMDBClient(None)._pick_best([], "Dune", None, "release_date", "title") is None
+
+
+# ---------------------------------------------------------------------------
+# Disk cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def tmdb_api(monkeypatch):
+    """Answer TMDB requests locally and record the searched endpoints."""
+    calls = []
+
+    def fake_request(_self, endpoint, _params=None):
+        if endpoint == "authentication":
+            return {"success": True}
+        calls.append(endpoint)
+        return {"results": [_movie(3, "Dune", "2021-09-15", 200.0)]}
+
+    monkeypatch.setattr(TMDBClient, "_make_request", fake_request)
+    return calls
+
+
+def test_disk_cache_reused_across_clients(tmp_path, tmdb_api):
+    cache_file = tmp_path / "cache" / "tmdb.json"
+
+    first = TMDBClient("key", str(cache_file))
+    assert first.search_movie("Dune", "2021") == (3, "2021")
+    assert not cache_file.exists()  # buffered until the end of the run
+    first.save_cache()
+
+    assert TMDBClient("key", str(cache_file)).search_movie("dune", "2021") == (3, "2021")
+    assert tmdb_api == ["search/movie"]
+
+
+def test_disk_cache_save_drops_expired_entries(tmp_path, tmdb_api):
+    cache_file = tmp_path / "tmdb.json"
+    client = TMDBClient("key", str(cache_file))
+    client.search_movie("Dune", "2021")
+    client._persisted[("search/movie", "old", "")] = (1, None, 0)
+    client._cache[("search/movie", "old", "")] = (1, None)
+
+    client.save_cache()
+
+    assert json.loads(cache_file.read_text()) == [["search/movie", "dune", "2021", 3, "2021", ANY]]
+    client.search_movie("Old")
+    assert tmdb_api == ["search/movie", "search/movie"]
+
+
+def test_disk_cache_skips_expired_entries(tmp_path, tmdb_api):
+    cache_file = tmp_path / "tmdb.json"
+    cache_file.write_text(json.dumps([["search/movie", "dune", "2021", 3, "2021", 0]]))
+
+    TMDBClient("key", str(cache_file)).search_movie("Dune", "2021")
+
+    assert tmdb_api == ["search/movie"]
+
+
+@pytest.mark.usefixtures("tmdb_api")
+def test_disk_cache_ignores_corrupt_file(tmp_path):
+    cache_file = tmp_path / "tmdb.json"
+    cache_file.write_text("{not json")
+
+    assert TMDBClient("key", str(cache_file)).search_movie("Dune", "2021") == (3, "2021")
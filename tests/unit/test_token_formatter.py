@@ -139,3 +139,11 @@ def test_collapse_spaces():
 def test_empty_string_token_treated_as_missing():
     result = format_tokens(MOVIE_PATTERN, {"title": "Film", "year": ""})
     assert result == "Film"
+
+
+def test_unused_tokens_do_not_change_result():
+    first = format_tokens(TV_SEASON_PATTERN, {"title": "Show", "season": "01", "episode": "01"})
+    second = format_tokens(TV_SEASON_PATTERN, {"title": "Show", "season": "01", "episode": "02"})
+    other = format_tokens(TV_SEASON_PATTERN, {"title": "Show", "season": "02", "episode": "01"})
+    assert first == second == "Season 01"
+    assert other == "Season 02"
@@ -0,0 +1,23 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from jfmo.transliteration import Transliterator
+from jfmo.transliteration.core import NgramModel
+
+
+def test_models_loaded_once_by_concurrent_workers(monkeypatch):
+    loaded = []
+    real_load = NgramModel.load
+
+    def slow_load(filepath):
+        loaded.append(filepath)
+        time.sleep(0.05)  # widen the window in which other workers arrive
+        return real_load(filepath)
+
+    monkeypatch.setattr(Transliterator, "_models_loaded", False)
+    monkeypatch.setattr(NgramModel, "load", staticmethod(slow_load))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: Transliterator._load_models(), range(4)))
+
+    assert len(loaded) == 2  # Russian and English model, once each